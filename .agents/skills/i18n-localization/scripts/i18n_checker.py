@@ -4,8 +4,12 @@ i18n Checker - Detects hardcoded strings and missing translations.
 Scans for untranslated text in React, Vue, and Python files.
 """
 import sys
+import os
+import argparse
 import re
 import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Fix Windows console encoding for Unicode output
@@ -50,22 +54,56 @@ I18N_PATTERNS = [
     r'i18n\.',             # Generic i18n
 ]
 
-def find_locale_files(project_path: Path) -> list:
+# Precompiled once at import: every file is matched against the same patterns
+HARDCODED_REGEXES = {
+    file_type: [re.compile(p) for p in patterns]
+    for file_type, patterns in HARDCODED_PATTERNS.items()
+}
+I18N_REGEX = re.compile('|'.join(f'(?:{p})' for p in I18N_PATTERNS))
+
+# Directories never scanned: dependencies, VCS/tool caches and build output.
+# Hidden directories (.git, .venv, .mypy_cache, ...) are always pruned too;
+# project-specific ones (generated sites, ...) are passed with --exclude.
+PRUNE_DIRS = {
+    'node_modules', 'dist', 'build', '__pycache__', 'venv', 'env',
+    'site-packages',
+}
+# Test code is not scanned for hardcoded strings: any directory or file whose
+# name contains one of these (tests/, __tests__/, spec/, foo.test.ts, ...)
+SKIP_PATH_MARKERS = ('test', 'spec')
+
+CODE_EXTENSIONS = {
+    '.tsx': 'jsx', '.jsx': 'jsx', '.ts': 'jsx', '.js': 'jsx',
+    '.vue': 'vue',
+    '.py': 'python'
+}
+
+# Per-file results keyed by mtime/size; invalidated when the patterns change
+CACHE_FILE = '.i18n_checker_cache.json'
+CACHE_VERSION = hashlib.sha1(
+    json.dumps([HARDCODED_PATTERNS, I18N_PATTERNS], sort_keys=True).encode()
+).hexdigest()[:12]
+
+# Directory names whose (nested) JSON files are locale catalogs
+LOCALE_DIRS = {'locales', 'translations', 'lang', 'i18n'}
+
+def find_locale_files(project_path: Path, exclude: frozenset = frozenset()) -> list:
     """Find translation/locale files."""
-    patterns = [
-        "**/locales/**/*.json",
-        "**/translations/**/*.json",
-        "**/lang/**/*.json",
-        "**/i18n/**/*.json",
-        "**/messages/*.json",
-        "**/*.po",  # gettext
-    ]
-    
+    # Same matches as the globs **/locales/**/*.json, **/translations/**/*.json,
+    # **/lang/**/*.json, **/i18n/**/*.json, **/messages/*.json and **/*.po,
+    # but in one pruned walk instead of six full-tree globs.
     files = []
-    for pattern in patterns:
-        files.extend(project_path.glob(pattern))
+    for dirpath, dirnames, filenames in os.walk(project_path):
+        dirnames[:] = [d for d in dirnames
+                       if d not in PRUNE_DIRS and d not in exclude and not d.startswith('.')]
+        parts = Path(dirpath).relative_to(project_path).parts
+        in_locale_dir = bool(LOCALE_DIRS.intersection(parts))
+        in_messages = bool(parts) and parts[-1] == 'messages'
+        for name in filenames:
+            if name.endswith('.po') or (name.endswith('.json') and (in_locale_dir or in_messages)):
+                files.append(Path(dirpath) / name)
     
-    return [f for f in files if 'node_modules' not in str(f)]
+    return sorted(files)
 
 def check_locale_completeness(locale_files: list) -> dict:
     """Check if all locales have the same keys."""
@@ -128,59 +166,94 @@ def flatten_keys(d, prefix=''):
             keys.add(new_key)
     return keys
 
-def check_hardcoded_strings(project_path: Path) -> dict:
+def is_test_path(name: str) -> bool:
+    return any(m in name.lower() for m in SKIP_PATH_MARKERS)
+
+def iter_code_files(project_path: Path, exclude: frozenset = frozenset()):
+    """Walk the project, pruning vendored/generated/test directories before descending."""
+    for dirpath, dirnames, filenames in os.walk(project_path):
+        dirnames[:] = [d for d in dirnames
+                       if d not in PRUNE_DIRS and d not in exclude
+                       and not d.startswith('.') and not is_test_path(d)]
+        for name in filenames:
+            ext = os.path.splitext(name)[1]
+            if ext in CODE_EXTENSIONS and not is_test_path(name):
+                yield Path(dirpath) / name
+
+def analyze_file(file_path: Path) -> dict:
+    """Scan one file: i18n usage flag plus the first match of each hardcoded pattern."""
+    content = file_path.read_text(encoding='utf-8', errors='ignore')
+    file_type = CODE_EXTENSIONS.get(file_path.suffix, 'jsx')
+    matches = []
+    for regex in HARDCODED_REGEXES.get(file_type, []):
+        match = regex.search(content)
+        if match:
+            # findall() semantics: first group if the pattern has one, else whole match
+            matches.append(match.group(1) if regex.groups else match.group(0))
+    return {'has_i18n': bool(I18N_REGEX.search(content)), 'matches': matches}
+
+def load_cache(project_path: Path) -> dict:
+    try:
+        cache = json.loads((project_path / CACHE_FILE).read_text(encoding='utf-8'))
+        if cache.get('version') == CACHE_VERSION:
+            return cache.get('files', {})
+    except (OSError, ValueError):
+        pass
+    return {}
+
+def save_cache(project_path: Path, files: dict) -> None:
+    try:
+        (project_path / CACHE_FILE).write_text(
+            json.dumps({'version': CACHE_VERSION, 'files': files}), encoding='utf-8')
+    except OSError:
+        pass  # read-only checkout: cache is an optimisation only
+
+def check_hardcoded_strings(project_path: Path, exclude: frozenset = frozenset()) -> dict:
     """Check for hardcoded strings in code files."""
     issues = []
     passed = []
     
-    # Find code files
-    extensions = {
-        '.tsx': 'jsx', '.jsx': 'jsx', '.ts': 'jsx', '.js': 'jsx',
-        '.vue': 'vue',
-        '.py': 'python'
-    }
-    
-    code_files = []
-    for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
-    
-    code_files = [f for f in code_files if not any(x in str(f) for x in 
-                  ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
+    code_files = sorted(iter_code_files(project_path, exclude))
     
     if not code_files:
         return {'passed': ["[!] No code files found"], 'issues': []}
     
+    cache = load_cache(project_path)
+    fresh_cache = {}
+    
+    def scan(file_path):
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        key = str(file_path.relative_to(project_path))
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        entry = cache.get(key)
+        if entry is None or entry['stamp'] != stamp:
+            try:
+                entry = {'stamp': stamp, **analyze_file(file_path)}
+            except OSError:
+                return None
+        fresh_cache[key] = entry
+        return file_path, entry
+    
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as pool:
+        results = [r for r in pool.map(scan, code_files) if r is not None]
+    save_cache(project_path, fresh_cache)
+    
     files_with_i18n = 0
     files_with_hardcoded = 0
     hardcoded_examples = []
     
-    for file_path in code_files[:50]:  # Limit
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            ext = file_path.suffix
-            file_type = extensions.get(ext, 'jsx')
-            
-            # Check for i18n usage
-            has_i18n = any(re.search(p, content) for p in I18N_PATTERNS)
-            if has_i18n:
-                files_with_i18n += 1
-            
-            # Check for hardcoded strings
-            patterns = HARDCODED_PATTERNS.get(file_type, [])
-            hardcoded_found = False
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, content)
-                if matches and not has_i18n:
-                    hardcoded_found = True
-                    if len(hardcoded_examples) < 5:
-                        hardcoded_examples.append(f"{file_path.name}: {str(matches[0])[:40]}...")
-            
-            if hardcoded_found:
-                files_with_hardcoded += 1
-                
-        except:
+    for file_path, entry in results:
+        if entry['has_i18n']:
+            files_with_i18n += 1
             continue
+        if entry['matches']:
+            files_with_hardcoded += 1
+            for match in entry['matches']:
+                if len(hardcoded_examples) < 5:
+                    hardcoded_examples.append(f"{file_path.name}: {str(match)[:40]}...")
     
     passed.append(f"[OK] Analyzed {len(code_files)} code files")
     
@@ -197,19 +270,24 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     return {'passed': passed, 'issues': issues}
 
 def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
-    project_path = Path(target)
+    parser = argparse.ArgumentParser(description="Detect hardcoded strings and missing translations.")
+    parser.add_argument("project_path", nargs="?", default=".")
+    parser.add_argument("--exclude", action="append", default=[], metavar="DIR",
+                        help="Directory name to skip (repeatable), e.g. generated output")
+    args = parser.parse_args()
+    project_path = Path(args.project_path)
+    exclude = frozenset(args.exclude)
     
     print("\n" + "=" * 60)
     print("  i18n CHECKER - Internationalization Audit")
     print("=" * 60 + "\n")
     
     # Check locale files
-    locale_files = find_locale_files(project_path)
+    locale_files = find_locale_files(project_path, exclude)
     locale_result = check_locale_completeness(locale_files)
     
     # Check hardcoded strings
-    code_result = check_hardcoded_strings(project_path)
+    code_result = check_hardcoded_strings(project_path, exclude)
     
     # Print results
     print("[LOCALE FILES]")
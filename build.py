@@ -2,10 +2,15 @@
 """Build script: generates CV, cover letter, and portfolio HTML files from templates + data."""
 
 import argparse
+import gzip
+import hashlib
 import json
 import os
+import re
 import shutil
 import sys
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -14,20 +19,13 @@ from jinja2 import Environment, FileSystemLoader
 ROOT = Path(__file__).parent
 DATA_FILE = ROOT / "data" / "cv.json"
 COVER_LETTER_FILE = ROOT / "data" / "cover_letter.json"
+LOCALES_FILE = ROOT / "data" / "locales.json"
+LOCALES_DIR = ROOT / "data" / "locales"
 TEMPLATE_DIR = ROOT / "templates"
 TEMPLATE_FILE = "cv.html"
 COVER_LETTER_TEMPLATE = "cover_letter.html"
 
-# Default output paths (also used by portfolio to verify CV files exist)
-OUTPUTS = {
-    "es": {"html": "docs/CV_español.html", "pdf": "CV-Alejandro-Ortiz-Perdomo-ES.pdf"},
-    "en": {"html": "docs/CV_english.html", "pdf": "CV-Alejandro-Ortiz-Perdomo-EN.pdf"},
-}
-
-COVER_LETTER_OUTPUTS = {
-    "es": {"html": "Carta_Presentacion.html", "pdf": "Carta_Presentacion.pdf"},
-    "en": {"html": "Cover_Letter.html", "pdf": "Cover_Letter.pdf"},
-}
+PDF_PREFIX = "CV-Alejandro-Ortiz-Perdomo"
 
 DOCS_DIR = ROOT / "docs"
 PORTFOLIO_TEMPLATES = {
@@ -36,8 +34,81 @@ PORTFOLIO_TEMPLATES = {
     "contact": {"template": "portfolio_contact.html", "output": "contact.html"},
 }
 
-# Portfolio language variants: {lang: file suffix}
-PORTFOLIO_LANGS = {"es": "", "en": "_en"}
+# Open Graph link previews: top of each rendered page as a compressed JPEG,
+# re-captured only when the page's content hash changes (docs/og/previews.json)
+OG_DIR = DOCS_DIR / "og"
+OG_MANIFEST = OG_DIR / "previews.json"
+OG_VIEWPORT = {"width": 1200, "height": 630}
+OG_JPEG_QUALITY = 70
+
+# Optional output stage for docs/ (--minify / --precompress)
+PRECOMPRESS_SUFFIXES = {".html", ".css", ".js", ".json", ".xml", ".txt", ".svg"}
+PRECOMPRESS_MIN_BYTES = 1024  # smaller files gain nothing from compression
+PRECOMPRESS_CACHE = ROOT / ".precompress_cache.json"
+
+# Printed layout budget checked by --preflight (A4 at 96 CSS px per inch)
+A4_VIEWPORT = {"width": 794, "height": 1123}
+# How long to wait for a page's render-ready signal (templates/_render_ready.html)
+RENDER_READY_TIMEOUT_MS = 15_000
+CV_MAX_PAGES = 3
+
+# Measures the print layout in one round-trip: page count, sections that run
+# past the page budget, and no-break blocks too tall to fit on a single page.
+# Pagination is simulated rather than read off one continuous strip: a
+# .item-no-break block that straddles a page boundary is pushed to the next page
+# (with the h3/h4 kept before it by break-after: avoid), and everything below it
+# in the same grid column moves down by the gap it leaves.
+_LAYOUT_PROBE = """
+([pageHeight, maxPages]) => {
+    const top = el => el.getBoundingClientRect().top + window.scrollY;
+    const bottom = el => el.getBoundingClientRect().bottom + window.scrollY;
+    const page = document.querySelector('.page') || document.body;
+    const label = el => (el.querySelector('h3, h4, p, strong') || el).innerText.trim().slice(0, 60);
+    const column = el => el.closest('.grid > *') || page;
+    // Per column: [y, total shift of everything from y down], in document order
+    const shifts = new Map();
+    const shiftAt = (col, y) => {
+        let shift = 0;
+        for (const [at, total] of shifts.get(col) || []) if (at <= y) shift = total;
+        return shift;
+    };
+    const keptHeading = el => {
+        let anchor = el;
+        while (!anchor.previousElementSibling && anchor.parentElement !== column(el)) anchor = anchor.parentElement;
+        const prev = anchor.previousElementSibling;
+        return prev && /^H[34]$/.test(prev.tagName) ? prev : null;
+    };
+    const unbreakable = [];
+    for (const el of document.querySelectorAll('.item-no-break')) {
+        if (el.parentElement.closest('.item-no-break')) continue;
+        const col = column(el);
+        if (!shifts.has(col)) shifts.set(col, []);
+        const shift = shiftAt(col, top(el));
+        const height = bottom(el) - top(el);
+        if (height > pageHeight) {
+            unbreakable.push({label: label(el), height: Math.round(height)});
+            continue;
+        }
+        const heading = keptHeading(el);
+        let start = top(el) + shift;
+        if (heading && bottom(el) - top(heading) <= pageHeight) start = top(heading) + shift;
+        const end = bottom(el) + shift;
+        const boundary = (Math.floor(start / pageHeight) + 1) * pageHeight;
+        if (end > boundary) shifts.get(col).push([start - shift, shift + boundary - start]);
+    }
+    const extra = Math.max(0, ...[...shifts.values()].map(list => list.length ? list[list.length - 1][1] : 0));
+    const height = Math.max(bottom(page), document.documentElement.scrollHeight) + extra;
+    const adjustedBottom = el => bottom(el) + shiftAt(column(el), bottom(el));
+    const limit = pageHeight * maxPages;
+    return {
+        pages: Math.max(1, Math.ceil(height / pageHeight)),
+        overflowing: [...document.querySelectorAll('section')]
+            .filter(el => adjustedBottom(el) > limit)
+            .map(el => ({label: label(el), page: Math.ceil(adjustedBottom(el) / pageHeight)})),
+        unbreakable,
+    };
+}
+"""
 
 
 def load_json(path: Path) -> dict:
@@ -45,6 +116,139 @@ def load_json(path: Path) -> dict:
         return json.load(f)
 
 
+# Locales are declared once in data/locales.json (ordered, first is the default)
+# with their UI strings in data/locales/<code>/ui.json. Every i18n field
+# ({"es": ..., "en": ...}) must provide each declared language.
+LOCALE_CONFIG = load_json(LOCALES_FILE)
+LOCALES = LOCALE_CONFIG["locales"]
+LANGS = tuple(LOCALES)
+
+COVER_LETTER_OUTPUTS = {
+    lang: {"html": locale["cover_letter"]["html"], "pdf": locale["cover_letter"]["pdf"]}
+    for lang, locale in LOCALES.items()
+}
+
+# Portfolio language variants: {lang: file suffix}
+PORTFOLIO_LANGS = {lang: locale["portfolio_suffix"] for lang, locale in LOCALES.items()}
+
+_catalogs: dict[str, dict] = {}
+
+
+def get_catalog(lang: str) -> dict:
+    """UI strings for a locale (data/locales/<lang>/ui.json), loaded once."""
+    if lang not in _catalogs:
+        _catalogs[lang] = load_json(LOCALES_DIR / lang / "ui.json")
+    return _catalogs[lang]
+
+
+def locale_context(lang: str) -> dict:
+    """Template variables for one locale: its code, UI catalog and metadata."""
+    return {"lang": lang, "ui": get_catalog(lang), "locale": LOCALES[lang]}
+
+
+def find_missing_translations(data, langs: list, path: str = "") -> list[str]:
+    """Walk data once and list i18n fields missing (or empty in) any required language.
+
+    A dict with a language key is an i18n pair; a dict with a "langs" list (e.g. an
+    experience entry) narrows the required languages for everything inside it,
+    including its items[lang] lists.
+    """
+    issues = []
+    if isinstance(data, list):
+        for i, value in enumerate(data):
+            issues += find_missing_translations(value, langs, f"{path}[{i}]")
+        return issues
+    if not isinstance(data, dict):
+        return issues
+
+    if "langs" in data:
+        entry_langs = data["langs"]
+        if not isinstance(entry_langs, list) or not entry_langs:
+            issues.append(f"{path}.langs: must be a non-empty list")
+            entry_langs = []
+        for lang in entry_langs:
+            if lang not in LANGS:
+                issues.append(f"{path}.langs: unknown language '{lang}'")
+        langs = [lang for lang in langs if lang in entry_langs]
+
+    if any(key in LANGS for key in data):
+        for lang in langs:
+            if data.get(lang) in (None, "", []):
+                issues.append(f"{path}: missing '{lang}'")
+            else:
+                issues += find_missing_translations(data[lang], langs, f"{path}.{lang}")
+        return issues
+
+    for key, value in data.items():
+        if key != "langs":
+            issues += find_missing_translations(value, langs, f"{path}.{key}" if path else key)
+    return issues
+
+
+def _catalog_keys(catalog: dict, prefix: str = "") -> dict[str, object]:
+    keys = {}
+    for key, value in catalog.items():
+        if isinstance(value, dict):
+            keys.update(_catalog_keys(value, f"{prefix}{key}."))
+        else:
+            keys[f"{prefix}{key}"] = value
+    return keys
+
+
+def find_missing_ui_strings(langs: list) -> list[str]:
+    """List UI catalog keys defined by the default locale but missing (or empty) in langs."""
+    reference = _catalog_keys(get_catalog(LANGS[0]))
+    issues = []
+    for lang in langs:
+        path = LOCALES_DIR / lang / "ui.json"
+        if not path.exists():
+            issues.append(f"{path.relative_to(ROOT)}: not found")
+            continue
+        strings = _catalog_keys(get_catalog(lang))
+        for key in reference:
+            if strings.get(key) in (None, ""):
+                issues.append(f"{path.relative_to(ROOT)}: missing '{key}'")
+    return issues
+
+
+# Catalog strings rendered through Jinja's |format (printf-style) may only use
+# '%' as a named placeholder %(name)s or an escaped '%%'
+_FORMATTED_UI_KEY = re.compile(r"ui\.([\w.]+)\s*\|\s*format\b")
+_FORMAT_TOKEN = re.compile(r"%%|%\(\w+\)s")
+
+
+def find_unescaped_percent(langs: list) -> list[str]:
+    """List |format-ed UI catalog strings with a bare '%' that would break rendering."""
+    formatted = {
+        key for template in TEMPLATE_DIR.glob("*.html")
+        for key in _FORMATTED_UI_KEY.findall(template.read_text(encoding="utf-8"))
+    }
+    issues = []
+    for lang in langs:
+        path = LOCALES_DIR / lang / "ui.json"
+        if not path.exists():
+            continue
+        strings = _catalog_keys(get_catalog(lang))
+        for key in sorted(formatted):
+            value = strings.get(key)
+            if isinstance(value, str) and "%" in _FORMAT_TOKEN.sub("", value):
+                issues.append(f"{path.relative_to(ROOT)}: unescaped '%' in '{key}' (use '%%')")
+    return issues
+
+
+def validate_data(files: dict, langs: list) -> None:
+    """Check {label: data} and the UI catalogs for missing translations and unsafe
+    format strings; exit before anything is rendered."""
+    issues = find_missing_ui_strings(langs) + find_unescaped_percent(langs)
+    for label, data in files.items():
+        issues += [f"{label}: {issue}" for issue in find_missing_translations(data, langs)]
+    if issues:
+        print(f"Translation problems ({', '.join(langs)}):")
+        for issue in issues:
+            print(f"  {issue}")
+        sys.exit(1)
+
+
 _jinja_env: Environment | None = None
 
 
@@ -53,38 +257,48 @@ def get_jinja_env() -> Environment:
     if _jinja_env is None:
         _jinja_env = Environment(loader=FileSystemLoader(TEMPLATE_DIR), autoescape=False)
         _jinja_env.globals["current_year"] = datetime.now().year
+        _jinja_env.globals["locales"] = LOCALES
+        _jinja_env.globals["x_default"] = LOCALE_CONFIG["x_default"]
     return _jinja_env
 
 
 def get_outputs(profile_name: str) -> dict:
-    """Return output paths for a given profile. Default profile has no suffix."""
-    if profile_name == "default":
-        return OUTPUTS
-    suffix = f"_{profile_name}"
-    # ASCII-safe PDF name: profile name with known acronyms uppercased
-    _acronyms = {"ai", "ml", "mlops"}
-    profile_label = "-".join(
-        w.upper() if w.lower() in _acronyms else w.capitalize()
-        for w in profile_name.split("-")
-    )
+    """Return {lang: {html, pdf}} output paths for a given profile. Default profile has no suffix."""
+    suffix = pdf_label = ""
+    if profile_name != "default":
+        suffix = f"_{profile_name}"
+        # ASCII-safe PDF name: profile name with known acronyms uppercased
+        _acronyms = {"ai", "ml", "mlops"}
+        pdf_label = "-" + "-".join(
+            w.upper() if w.lower() in _acronyms else w.capitalize()
+            for w in profile_name.split("-")
+        )
     return {
-        "es": {"html": f"docs/CV_español{suffix}.html", "pdf": f"CV-Alejandro-Ortiz-Perdomo-{profile_label}-ES.pdf"},
-        "en": {"html": f"docs/CV_english{suffix}.html", "pdf": f"CV-Alejandro-Ortiz-Perdomo-{profile_label}-EN.pdf"},
+        lang: {
+            "html": f"docs/{locale['cv_html']}{suffix}.html",
+            "pdf": f"{PDF_PREFIX}{pdf_label}-{locale['pdf_suffix']}.pdf",
+        }
+        for lang, locale in LOCALES.items()
     }
 
 
-def render_cv(cv_data: dict, lang: str, api_key: str, pdf_filename: str = "",
-              profile_name: str = "default") -> str:
+# Default output paths (also used by portfolio to verify CV files exist)
+OUTPUTS = get_outputs("default")
+
+
+def render_cv(cv_data: Mapping, lang: str, api_key: str, pdf_filename: str = "",
+              profile_name: str = "default", og_image: str = "") -> str:
+    """og_image: link preview path relative to the site root; empty uses profile.jpg."""
     env = get_jinja_env()
     template = env.get_template(TEMPLATE_FILE)
-    return template.render(cv=cv_data, lang=lang, api_key=api_key,
-                           pdf_filename=pdf_filename, profile_name=profile_name)
+    return template.render(cv=cv_data, api_key=api_key, pdf_filename=pdf_filename,
+                           profile_name=profile_name, og_image=og_image, **locale_context(lang))
 
 
-def render_cover_letter(cv_data: dict, letter_data: dict, lang: str) -> str:
+def render_cover_letter(cv_data: Mapping, letter_data: Mapping, lang: str) -> str:
     env = get_jinja_env()
     template = env.get_template(COVER_LETTER_TEMPLATE)
-    return template.render(cv=cv_data, letter=letter_data, lang=lang)
+    return template.render(cv=cv_data, letter=letter_data, **locale_context(lang))
 
 
 def _handle_pdf_error(e: Exception) -> None:
@@ -96,13 +310,15 @@ def _handle_pdf_error(e: Exception) -> None:
 
 
 def add_pdf_metadata(pdf_path: Path, title: str, author: str, subject: str = "") -> None:
-    """Inject author/title/subject metadata into a PDF using pypdf."""
+    """Inject author/title/subject metadata into a PDF using pypdf.
+
+    The document is cloned, not rebuilt page by page, so Chromium's outline
+    (bookmarks) and tagged structure are kept.
+    """
     try:
         from pypdf import PdfReader, PdfWriter
 
-        reader = PdfReader(pdf_path)
-        writer = PdfWriter()
-        writer.append_pages_from_reader(reader)
+        writer = PdfWriter(clone_from=PdfReader(pdf_path))
         writer.add_metadata({
             "/Title": title,
             "/Author": author,
@@ -115,10 +331,125 @@ def add_pdf_metadata(pdf_path: Path, title: str, author: str, subject: str = "")
         pass  # pypdf not installed, skip metadata
 
 
+def preview_path(html_path: Path) -> Path:
+    """Open Graph image for a rendered page: docs/og/<page>.jpg."""
+    return OG_DIR / f"{html_path.stem}.jpg"
+
+
+def _preview_hash(html_path: Path) -> str:
+    digest = hashlib.sha256(html_path.read_bytes())
+    css = DOCS_DIR / "static" / "styles.css"
+    if css.exists():
+        digest.update(css.read_bytes())
+    digest.update(f"{OG_VIEWPORT}:{OG_JPEG_QUALITY}".encode())
+    return digest.hexdigest()
+
+
+def og_image_for(html_path: Path, capturing: bool) -> str:
+    """Preview to link as og:image: only one that exists or is captured in this run,
+    so published pages never point at a missing image ("" falls back to profile.jpg)."""
+    image = preview_path(html_path)
+    return str(image.relative_to(DOCS_DIR)) if capturing or image.exists() else ""
+
+
+def stale_previews(html_paths: list) -> dict:
+    """Return {html path: content hash} for pages whose preview is missing or outdated."""
+    manifest = load_json(OG_MANIFEST) if OG_MANIFEST.exists() else {}
+    stale = {}
+    for html_path in html_paths:
+        digest = _preview_hash(html_path)
+        if manifest.get(html_path.name) != digest or not preview_path(html_path).exists():
+            stale[html_path] = digest
+    return stale
+
+
+def record_previews(captured: dict) -> None:
+    """Store the content hash of every preview that was written."""
+    manifest = load_json(OG_MANIFEST) if OG_MANIFEST.exists() else {}
+    for html_path, digest in captured.items():
+        if preview_path(html_path).exists():
+            manifest[html_path.name] = digest
+    OG_MANIFEST.write_text(json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
+                           encoding="utf-8")
+
+
+_READY_DIAGNOSTIC = """() => ({
+    readyState: document.readyState,
+    fonts: document.fonts.status,
+    pending: [...document.fonts].filter(f => f.status === 'loading').map(f => f.family),
+})"""
+
+
+def open_when_ready(page, html_path: Path, timeout: int = RENDER_READY_TIMEOUT_MS) -> None:
+    """Load a rendered HTML file and wait for its render-ready signal.
+
+    Templates set window.__renderReady once load, web fonts and layout have settled,
+    so pages are printed as soon as they are ready instead of after a networkidle
+    window. If the signal never fires, the page state is reported and the caller
+    goes ahead with what has rendered.
+    """
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    page.goto(f"file://{Path(html_path).resolve()}", wait_until="load")
+    try:
+        page.wait_for_function("window.__renderReady === true", timeout=timeout)
+    except PlaywrightTimeoutError:
+        state = page.evaluate(_READY_DIAGNOSTIC)
+        pending = ", ".join(state["pending"]) or "none"
+        print(f"  Warning: {Path(html_path).name} not ready after {timeout} ms "
+              f"(document {state['readyState']}, fonts {state['fonts']}, pending fonts: {pending})")
+
+
+def capture_preview(page, image_path: Path) -> None:
+    """Screenshot the top of an already loaded page as an Open Graph thumbnail."""
+    image_path.parent.mkdir(parents=True, exist_ok=True)
+    page.set_viewport_size(OG_VIEWPORT)
+    page.screenshot(path=str(image_path), type="jpeg", quality=OG_JPEG_QUALITY)
+
+
+def capture_previews(html_paths: list) -> None:
+    """Capture previews for pages that are not printed (portfolio) in one browser session."""
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        page = browser.new_page(viewport=OG_VIEWPORT)
+        for html_path in html_paths:
+            open_when_ready(page, html_path)
+            capture_preview(page, preview_path(html_path))
+            print(f"  Preview: docs/og/{preview_path(html_path).name}")
+        browser.close()
+
+
+def merge_pdfs(parts: list, output_path: Path, title: str, author: str, subject: str = "") -> None:
+    """Concatenate already-rendered PDFs into one file without re-rendering.
+
+    parts: list of (pdf path, outline label). Pages are copied as PDF objects;
+    each part gets a top-level bookmark, with the part's own outline (the section
+    bookmarks Chromium writes, kept by add_pdf_metadata) nested under it. The
+    parts' tagged structure trees are not carried over.
+    """
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for pdf_path, label in parts:
+        writer.append(pdf_path, outline_item=label)
+    writer.add_metadata({
+        "/Title": title,
+        "/Author": author,
+        "/Subject": subject or "Curriculum Vitae",
+        "/Creator": "curriculum_HV build system",
+    })
+    writer.page_mode = "/UseOutlines"
+    with open(output_path, "wb") as f:
+        writer.write(f)
+
+
 def generate_pdfs(jobs: list, margin: dict):
     """Generate PDFs in a single browser session.
 
-    jobs: list of {"html": str, "pdf": str} dicts (paths relative to ROOT).
+    jobs: list of {"html": str, "pdf": str} dicts (paths relative to ROOT). A job
+    with a "preview" key also gets its Open Graph image captured from the same page.
     margin: dict with top/bottom/left/right CSS values.
     """
     from playwright.sync_api import sync_playwright
@@ -129,8 +460,7 @@ def generate_pdfs(jobs: list, margin: dict):
             html_path = (ROOT / files["html"]).resolve()
             pdf_path = ROOT / files["pdf"]
             page = browser.new_page()
-            page.goto(f"file://{html_path}", wait_until="networkidle")
-            page.evaluate("async () => { await document.fonts.ready; }")
+            open_when_ready(page, html_path)
             page.pdf(
                 path=str(pdf_path),
                 format="A4",
@@ -139,13 +469,66 @@ def generate_pdfs(jobs: list, margin: dict):
                 tagged=True,
                 outline=True,
             )
+            if files.get("preview"):
+                capture_preview(page, ROOT / files["preview"])
+                print(f"  Preview: {files['preview']}")
             page.close()
             print(f"  PDF: {pdf_path.name}")
         browser.close()
 
 
+def generate_locale_pdfs(jobs_by_lang: dict, margin: dict):
+    """Generate each locale's PDFs in its own browser session, locales in parallel.
+
+    jobs_by_lang: {lang: [{"html": str, "pdf": str}, ...]}. Playwright's sync API
+    is per-thread, so every worker starts its own Playwright and Chromium.
+    """
+    batches = [jobs for jobs in jobs_by_lang.values() if jobs]
+    if len(batches) <= 1:
+        for jobs in batches:
+            generate_pdfs(jobs, margin)
+        return
+    workers = min(len(batches), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(generate_pdfs, jobs, margin) for jobs in batches]:
+            future.result()
+
+
+def preflight_layouts(jobs: list, max_pages: int) -> bool:
+    """Check the printed layout of rendered HTML files without printing PDFs.
+
+    Each file is loaded once with print media emulated at A4 width and measured
+    with a single page.evaluate. Returns True when every job fits the budget.
+    """
+    from playwright.sync_api import sync_playwright
+
+    ok = True
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        page = browser.new_page(viewport=A4_VIEWPORT)
+        page.emulate_media(media="print")
+        for files in jobs:
+            html_path = (ROOT / files["html"]).resolve()
+            open_when_ready(page, html_path)
+            layout = page.evaluate(_LAYOUT_PROBE, [A4_VIEWPORT["height"], max_pages])
+            problems = []
+            if layout["pages"] > max_pages:
+                problems.append(f"{layout['pages']} pages (max {max_pages})")
+            for section in layout["overflowing"]:
+                problems.append(f"section '{section['label']}' runs onto page {section['page']}")
+            for block in layout["unbreakable"]:
+                problems.append(f"block '{block['label']}' is taller than a page ({block['height']}px)")
+            status = "FAIL" if problems else "ok"
+            print(f"  {status}: {html_path.name} — {layout['pages']} page(s)")
+            for problem in problems:
+                print(f"    - {problem}")
+            ok = ok and not problems
+        browser.close()
+    return ok
+
+
 def build_cv(cv_data: dict, api_key: str, langs: list, html_only: bool,
-             profiles_to_build: dict):
+             profiles_to_build: dict, preflight: bool = False):
     """Build CVs for the given profiles and languages."""
     # Ensure docs/ and docs/static/ exist
     DOCS_DIR.mkdir(exist_ok=True)
@@ -156,7 +539,7 @@ def build_cv(cv_data: dict, api_key: str, langs: list, html_only: bool,
         if src.exists():
             shutil.copy2(src, docs_static / fname)
 
-    all_jobs = []  # Collect {html, pdf} for batch PDF generation
+    jobs_by_lang = {lang: [] for lang in langs}  # {html, pdf} per locale for PDF generation
     author = cv_data.get("personal", {}).get("name", "")
 
     for profile_name, profile_data in profiles_to_build.items():
@@ -170,17 +553,39 @@ def build_cv(cv_data: dict, api_key: str, langs: list, html_only: bool,
             if lang not in outputs:
                 continue
             pdf_filename = outputs[lang]["pdf"]
-            html = render_cv(data, lang, api_key, pdf_filename, profile_name)
             output_path = ROOT / outputs[lang]["html"]
+            # Previews are captured in the PDF pass
+            og_image = og_image_for(output_path, capturing=not html_only)
+            html = render_cv(data, lang, api_key, pdf_filename, profile_name, og_image)
             output_path.write_text(html, encoding="utf-8")
             print(f"  HTML: {output_path.name}")
-            all_jobs.append(outputs[lang])
+            jobs_by_lang[lang].append(outputs[lang])
+
+    all_jobs = [files for jobs in jobs_by_lang.values() for files in jobs]
+
+    if preflight and all_jobs:
+        print("Checking CV print layout...")
+        try:
+            passed = preflight_layouts(all_jobs, CV_MAX_PAGES)
+        except Exception as e:
+            _handle_pdf_error(e)
+        if not passed:
+            print("\n  Preflight failed: no PDFs were generated.")
+            sys.exit(1)
 
     if not html_only and all_jobs:
         print("Generating CV PDF files...")
         cv_margin = {"top": "0", "bottom": "0", "left": "0", "right": "0"}
+        # Previews ride along with the PDF pass; unchanged pages keep their image
+        stale = stale_previews([ROOT / files["html"] for files in all_jobs])
+        for jobs in jobs_by_lang.values():
+            for i, files in enumerate(jobs):
+                html_path = ROOT / files["html"]
+                if html_path in stale:
+                    jobs[i] = {**files, "preview": str(preview_path(html_path).relative_to(ROOT))}
         try:
-            generate_pdfs(all_jobs, cv_margin)
+            generate_locale_pdfs(jobs_by_lang, cv_margin)
+            record_previews(stale)
             # Add metadata and copy PDFs to docs/
             for files in all_jobs:
                 pdf_src = ROOT / files["pdf"]
@@ -214,38 +619,58 @@ def build_cover_letter(cv_data: dict, html_only: bool, langs: list | None = None
 
     if not html_only:
         letter_margin = {"top": "0", "bottom": "0", "left": "0", "right": "0"}
-        letter_jobs = [
-            {"html": COVER_LETTER_OUTPUTS[l]["html"], "pdf": COVER_LETTER_OUTPUTS[l]["pdf"]}
-            for l in langs
-        ]
+        letter_jobs = {l: [COVER_LETTER_OUTPUTS[l]] for l in langs}
         try:
-            generate_pdfs(letter_jobs, letter_margin)
+            generate_locale_pdfs(letter_jobs, letter_margin)
             for l in langs:
                 pdf_path = ROOT / COVER_LETTER_OUTPUTS[l]["pdf"]
                 if pdf_path.exists():
-                    subject = "Carta de Presentación" if l == "es" else "Cover Letter"
+                    subject = LOCALES[l]["cover_letter"]["subject"]
                     add_pdf_metadata(pdf_path, f"{author} — {subject}", author, subject)
         except Exception as e:
             _handle_pdf_error(e)
 
 
-def build_portfolio(cv_data: dict):
+def build_portfolio(cv_data: dict, previews: bool = False):
     DOCS_DIR.mkdir(exist_ok=True)
     env = get_jinja_env()
     print("Generating portfolio pages...")
+    pages = {}  # output path -> render kwargs, to re-render if previews fail
+
+    def write_page(output_path: Path, og_image: str) -> None:
+        html = env.get_template(pages[output_path]["template"]).render(
+            og_image=og_image, **pages[output_path]["context"],
+        )
+        output_path.write_text(html, encoding="utf-8")
+
     for lang, suffix in PORTFOLIO_LANGS.items():
-        other_suffix = "_en" if lang == "es" else ""
         for page_name, config in PORTFOLIO_TEMPLATES.items():
-            template = env.get_template(config["template"])
             base = config["output"].removesuffix(".html")
             output_name = f"{base}{suffix}.html"
-            html = template.render(
-                cv=cv_data, active_page=page_name, lang=lang,
-                page_suffix=suffix, other_page_suffix=other_suffix,
-            )
             output_path = DOCS_DIR / output_name
-            output_path.write_text(html, encoding="utf-8")
+            pages[output_path] = {
+                "template": config["template"],
+                "context": dict(cv=cv_data, active_page=page_name, page_suffix=suffix,
+                                **locale_context(lang)),
+            }
+            write_page(output_path, og_image_for(output_path, capturing=previews))
             print(f"  HTML: docs/{output_name}")
+    written = list(pages)
+    # Link previews for changed pages only, on request: loading the pages pulls CDN
+    # and analytics resources, which would stall an offline build
+    stale = stale_previews(written)
+    if stale and not previews:
+        print(f"  Note: {len(stale)} link preview(s) out of date; rebuild with --previews to refresh")
+    elif stale:
+        try:
+            capture_previews(list(stale))
+            record_previews(stale)
+        except Exception as e:
+            print(f"  Note: previews not captured ({e}); run 'uv run playwright install chromium'")
+            # Pages were rendered expecting their preview: link profile.jpg instead
+            for output_path in stale:
+                if not preview_path(output_path).exists():
+                    write_page(output_path, "")
     # Verify CV HTMLs exist in docs/ (generated by 'make build')
     for lang, files in OUTPUTS.items():
         cv_path = ROOT / files["html"]
@@ -265,11 +690,10 @@ def build_portfolio(cv_data: dict):
     base_url = cv_data.get("personal", {}).get("portfolio", {}).get("url", "")
     if base_url:
         pages = [
-            "index.html", "index_en.html",
-            "projects.html", "projects_en.html",
-            "contact.html", "contact_en.html",
-            "CV_español.html", "CV_english.html",
-        ]
+            f"{config['output'].removesuffix('.html')}{suffix}.html"
+            for config in PORTFOLIO_TEMPLATES.values()
+            for suffix in PORTFOLIO_LANGS.values()
+        ] + [Path(files["html"]).name for files in OUTPUTS.values()]
         sitemap_entries = "\n".join(
             f"  <url><loc>{base_url}{page}</loc></url>" for page in pages
         )
@@ -285,6 +709,123 @@ def build_portfolio(cv_data: dict):
     print("Portfolio generated in docs/")
 
 
+# Elements whose content is whitespace-sensitive or not HTML; kept out of minification
+_RAW_BLOCK = re.compile(r"<(pre|textarea|script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_JSON_LD = re.compile(r"(<script\b[^>]*application/ld\+json[^>]*>)(.*?)(</script\s*>)", re.IGNORECASE | re.DOTALL)
+_COMMENT = re.compile(r"<!--(?!\[if).*?-->", re.DOTALL)
+_NEWLINE_RUN = re.compile(r"\s*\n\s*")
+_SPACE_RUN = re.compile(r"[ \t\r\f]{2,}")
+
+
+def _minify_markup(text: str) -> str:
+    text = _COMMENT.sub("", text)
+    # A run with a newline stays a newline so inline handlers keep statement breaks
+    text = _NEWLINE_RUN.sub("\n", text)
+    return _SPACE_RUN.sub(" ", text)
+
+
+def _compact_json_ld(block: str) -> str:
+    match = _JSON_LD.fullmatch(block)
+    if not match:
+        return block
+    try:
+        data = json.loads(match.group(2))
+    except json.JSONDecodeError:
+        return block
+    return match.group(1) + json.dumps(data, ensure_ascii=False, separators=(",", ":")) + match.group(3)
+
+
+def minify_html(html: str) -> str:
+    """Drop comments and collapse whitespace outside <pre>, <textarea>, <script> and <style>.
+
+    Those blocks are copied verbatim, except JSON-LD which is re-serialized compactly.
+    Collapsing only merges whitespace runs, so rendering is unchanged.
+    """
+    parts = []
+    pos = 0
+    for match in _RAW_BLOCK.finditer(html):
+        parts.append(_minify_markup(html[pos:match.start()]))
+        parts.append(_compact_json_ld(match.group(0)))
+        pos = match.end()
+    parts.append(_minify_markup(html[pos:]))
+    return "".join(parts).strip() + "\n"
+
+
+def minify_docs() -> None:
+    """Minify every HTML page in docs/ in place (idempotent)."""
+    print("Minifying docs/ HTML...")
+    before = after = 0
+    pages = sorted(DOCS_DIR.glob("*.html"))
+    for path in pages:
+        html = path.read_text(encoding="utf-8")
+        minified = minify_html(html)
+        if minified != html:
+            path.write_text(minified, encoding="utf-8")
+        before += len(html.encode("utf-8"))
+        after += len(minified.encode("utf-8"))
+    print(f"  {len(pages)} page(s): {before / 1024:.1f} KB -> {after / 1024:.1f} KB")
+
+
+def precompress_docs() -> None:
+    """Write .gz (and .br if the brotli package is installed) next to docs/ text files.
+
+    Files are compressed in parallel; a file whose content hash matches the last run
+    and whose siblings exist is skipped. Siblings whose source was deleted or fell
+    under PRECOMPRESS_MIN_BYTES are removed so hosts stop serving them.
+    """
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+        print("  Note: brotli not installed, writing .gz only (uv sync --extra compress)")
+
+    cache = load_json(PRECOMPRESS_CACHE) if PRECOMPRESS_CACHE.exists() else {}
+    files = [
+        path for path in sorted(DOCS_DIR.rglob("*"))
+        if path.is_file() and path.suffix in PRECOMPRESS_SUFFIXES
+        and path.stat().st_size >= PRECOMPRESS_MIN_BYTES
+    ]
+
+    def compress(path: Path) -> tuple[str, str, bool]:
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        key = str(path.relative_to(ROOT))
+        gz_path = path.with_name(path.name + ".gz")
+        br_path = path.with_name(path.name + ".br")
+        if cache.get(key) == digest and gz_path.exists() and (brotli is None or br_path.exists()):
+            return key, digest, False
+        gz_path.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+        if brotli is not None:
+            br_path.write_bytes(brotli.compress(data, quality=11))
+        else:
+            br_path.unlink(missing_ok=True)  # from an earlier run with brotli, now outdated
+        return key, digest, True
+
+    print("Precompressing docs/...")
+    with ThreadPoolExecutor() as pool:
+        results = list(pool.map(compress, files))
+    current = set(files)
+    removed = 0
+    for sibling in sorted([*DOCS_DIR.rglob("*.gz"), *DOCS_DIR.rglob("*.br")]):
+        source = sibling.with_suffix("")
+        if source.suffix in PRECOMPRESS_SUFFIXES and source not in current:
+            sibling.unlink()
+            removed += 1
+    # Rebuilt from this run only, so entries for dropped files go away too
+    cache = {key: digest for key, digest, _ in results}
+    PRECOMPRESS_CACHE.write_text(json.dumps(cache, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    written = sum(changed for _, _, changed in results)
+    print(f"  {written} file(s) compressed, {len(results) - written} unchanged, {removed} stale removed")
+
+
+def optimize_docs(minify: bool, precompress: bool) -> None:
+    """Optional output stage, run after PDFs and previews are made from the readable HTML."""
+    if minify:
+        minify_docs()
+    if precompress:
+        precompress_docs()
+
+
 def get_api_key() -> str:
     api_key = os.environ.get("GEMINI_API_KEY", "")
     if not api_key:
@@ -305,14 +846,36 @@ def parse_args() -> argparse.Namespace:
         "target",
         nargs="?",
         default=None,
-        choices=["es", "en", "carta", "carta-es", "carta-en", "portfolio"],
-        help="Build target (default: all CV profiles in both languages)",
+        choices=[*LANGS, "carta", *(f"carta-{lang}" for lang in LANGS), "portfolio", "validate"],
+        help="Build target (default: all CV profiles in every locale)",
     )
     parser.add_argument(
         "--html-only",
         action="store_true",
         help="Skip PDF generation, generate HTML only",
     )
+    parser.add_argument(
+        "--preflight",
+        action="store_true",
+        help=f"Check CV print layout (max {CV_MAX_PAGES} A4 pages) before generating PDFs; "
+             "with --html-only, only run the check",
+    )
+    parser.add_argument(
+        "--minify",
+        action="store_true",
+        help="Minify docs/ HTML after building (whitespace, comments, JSON-LD)",
+    )
+    parser.add_argument(
+        "--precompress",
+        action="store_true",
+        help="Write .gz/.br siblings for docs/ text files (unchanged files are skipped)",
+    )
+    parser.add_argument(
+        "--previews",
+        action="store_true",
+        help="Capture link preview images for changed portfolio pages (needs Chromium; "
+             "CV previews are always taken during the PDF pass)",
+    )
     parser.add_argument(
         "--profile",
         type=str,
@@ -342,14 +905,25 @@ def main():
 
     target = args.target
 
+    # Data validation only (fast, no rendering)
+    if target == "validate":
+        files = {DATA_FILE.name: cv_data}
+        if COVER_LETTER_FILE.exists():
+            files[COVER_LETTER_FILE.name] = load_json(COVER_LETTER_FILE)
+        validate_data(files, list(LANGS))
+        print(f"Translations complete: {', '.join(files)}")
+        return
+
     # Cover letter targets
-    if target in ("carta", "carta-es", "carta-en"):
+    if target == "carta" or (target or "").startswith("carta-"):
         cv_data["profile"] = all_profiles.get("default", {})
         carta_langs = list(COVER_LETTER_OUTPUTS.keys())
-        if target == "carta-es":
-            carta_langs = ["es"]
-        elif target == "carta-en":
-            carta_langs = ["en"]
+        if target != "carta":
+            carta_langs = [target.removeprefix("carta-")]
+        files = {DATA_FILE.name: cv_data}
+        if COVER_LETTER_FILE.exists():
+            files[COVER_LETTER_FILE.name] = load_json(COVER_LETTER_FILE)
+        validate_data(files, carta_langs)
         build_cover_letter(cv_data, args.html_only, carta_langs)
         print("\nDone!")
         return
@@ -357,16 +931,20 @@ def main():
     # Portfolio target
     if target == "portfolio":
         cv_data["profile"] = all_profiles.get("default", {})
-        build_portfolio(cv_data)
+        validate_data({DATA_FILE.name: cv_data}, list(PORTFOLIO_LANGS))
+        build_portfolio(cv_data, args.previews)
+        optimize_docs(args.minify, args.precompress)
         print("\nDone!")
         return
 
     # CV targets (default)
-    langs = ["es", "en"]
-    if target in ("es", "en"):
+    langs = list(LANGS)
+    if target in LANGS:
         langs = [target]
 
-    build_cv(cv_data, api_key, langs, args.html_only, profiles_to_build)
+    validate_data({DATA_FILE.name: cv_data}, langs)
+    build_cv(cv_data, api_key, langs, args.html_only, profiles_to_build, args.preflight)
+    optimize_docs(args.minify, args.precompress)
     print("\nDone!")
 
 
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""Local stand-in for the Anthropic Messages API: replays recorded tailoring results.
+
+Lets tailor.py run offline (tests, benchmarks) with configurable latency,
+streaming, errors and truncation. Blocks marked with cache_control are tracked
+like the real prompt cache (5 minute TTL) and reported in the usage block. Point tailor.py at it with:
+
+    uv run python mock_llm.py
+    ANTHROPIC_API_KEY=mock uv run python tailor.py --base-url http://127.0.0.1:8765
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+DEFAULT_FIXTURES = [
+    "applications/*/tailoring_result.json",
+    "data/tailoring_result_sample.json",
+]
+CACHE_TTL = 300  # seconds; ephemeral cache entries expire after 5 minutes unused
+
+
+def slugify(text: str) -> str:
+    """Same slug rules as tailor.slugify (kept local so the mock needs no API deps)."""
+    slug = text.lower().strip()
+    slug = re.sub(r"[^\w\s-]", "", slug)
+    slug = re.sub(r"[\s_]+", "-", slug)
+    return re.sub(r"-+", "-", slug).strip("-")
+
+
+def load_fixtures(patterns: list[str]) -> dict[str, str]:
+    """Load fixtures as {name: response text}. Name is the application slug."""
+    fixtures = {}
+    for pattern in patterns:
+        path = Path(pattern)
+        matches = sorted(ROOT.glob(pattern)) if not path.is_absolute() else [path]
+        for match in matches:
+            if not match.is_file():
+                continue
+            recorded = json.loads(match.read_text(encoding="utf-8"))
+            # Keys starting with "_" are bookkeeping added by tailor.py, not model output
+            text = json.dumps({key: value for key, value in recorded.items() if not key.startswith("_")},
+                              ensure_ascii=False)
+            name = match.parent.name if match.name == "tailoring_result.json" else match.stem
+            fixtures[name] = text
+    return fixtures
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 chars per token) for the usage block."""
+    return max(1, len(text) // 4)
+
+
+class MockState:
+    """Fixture selection, fault injection and counters shared by handler threads."""
+
+    def __init__(self, fixtures: dict[str, str], args: argparse.Namespace):
+        self.fixtures = fixtures
+        self.args = args
+        self.random = random.Random(args.seed)
+        self.cycle = itertools.cycle(sorted(fixtures))
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.prompt_cache = {}  # sha256 of the cached prefix -> expiry (monotonic)
+
+    def cache_usage(self, model: str, blocks: list[str], cached_upto: int) -> dict:
+        """Token usage for a prompt whose first cached_upto blocks are cacheable."""
+        prefix = "".join(blocks[:cached_upto])
+        rest = "".join(blocks[cached_upto:])
+        usage = {"input_tokens": estimate_tokens(rest) if rest else 0,
+                 "cache_creation_input_tokens": 0, "cache_read_input_tokens": 0}
+        if not prefix:
+            return usage
+        key = hashlib.sha256(f"{model}\0{prefix}".encode("utf-8")).hexdigest()
+        now = time.monotonic()
+        with self.lock:
+            hit = self.prompt_cache.get(key, 0) > now
+            self.prompt_cache[key] = now + CACHE_TTL
+        usage["cache_read_input_tokens" if hit else "cache_creation_input_tokens"] = estimate_tokens(prefix)
+        return usage
+
+    def pick(self, prompt: str) -> tuple[str, str]:
+        """Prefer the fixture recorded for the offer's company; else round-robin."""
+        match = re.search(r"^- Company: (.+)$", prompt, re.MULTILINE)
+        if match and slugify(match.group(1)) in self.fixtures:
+            name = slugify(match.group(1))
+            return name, self.fixtures[name]
+        with self.lock:
+            name = next(self.cycle)
+        return name, self.fixtures[name]
+
+    def roll(self, rate: float) -> bool:
+        with self.lock:
+            return self.random.random() < rate
+
+    def delay(self) -> float:
+        with self.lock:
+            jitter = self.random.uniform(-self.args.jitter, self.args.jitter)
+        return max(0.0, self.args.latency + jitter)
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    server_version = "MockLLM/1.0"
+    state: MockState
+
+    def log_message(self, format, *args):
+        pass  # one summary line per request is printed in do_POST
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_event(self, event: str, data: dict) -> None:
+        self.wfile.write(f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+    def do_POST(self):
+        if self.path.split("?")[0] != "/v1/messages":
+            self._send_json(404, {"type": "error", "error": {"type": "not_found_error", "message": self.path}})
+            return
+
+        state = self.state
+        args = state.args
+        started = time.perf_counter()
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        with state.lock:
+            state.requests += 1
+            request_no = state.requests
+
+        # Cache order is system, then messages; the prefix ends at the last cache_control
+        system = request.get("system", [])
+        blocks = (system if isinstance(system, list) else [system]) + [
+            block
+            for message in request.get("messages", [])
+            for block in (message["content"] if isinstance(message["content"], list) else [message["content"]])
+        ]
+        texts = [block.get("text", "") if isinstance(block, dict) else str(block) for block in blocks]
+        cached_upto = max(
+            (i + 1 for i, block in enumerate(blocks) if isinstance(block, dict) and block.get("cache_control")),
+            default=0,
+        )
+        prompt = "".join(texts)
+        name, text = state.pick(prompt)
+        time.sleep(state.delay())
+
+        if state.roll(args.error_rate):
+            self._send_json(args.error_status, {
+                "type": "error",
+                "error": {"type": "overloaded_error", "message": "Injected error from mock_llm"},
+            })
+            print(f"  #{request_no} {name}: HTTP {args.error_status} (injected)")
+            return
+
+        stop_reason = "end_turn"
+        if state.roll(args.truncate):
+            text = text[: len(text) // 2]
+            stop_reason = "max_tokens"
+
+        message_id = f"msg_mock_{uuid.uuid4().hex[:24]}"
+        model = request.get("model", "mock")
+        usage = {**state.cache_usage(model, texts, cached_upto), "output_tokens": estimate_tokens(text)}
+
+        if request.get("stream"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            self._send_event("message_start", {"type": "message_start", "message": {
+                "id": message_id, "type": "message", "role": "assistant", "model": model,
+                "content": [], "stop_reason": None, "stop_sequence": None,
+                "usage": {**usage, "output_tokens": 1},
+            }})
+            self._send_event("content_block_start", {
+                "type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""},
+            })
+            for i in range(0, len(text), args.chunk_size):
+                self._send_event("content_block_delta", {
+                    "type": "content_block_delta", "index": 0,
+                    "delta": {"type": "text_delta", "text": text[i:i + args.chunk_size]},
+                })
+                time.sleep(args.chunk_delay)
+            self._send_event("content_block_stop", {"type": "content_block_stop", "index": 0})
+            self._send_event("message_delta", {
+                "type": "message_delta",
+                "delta": {"stop_reason": stop_reason, "stop_sequence": None},
+                "usage": {"output_tokens": usage["output_tokens"]},
+            })
+            self._send_event("message_stop", {"type": "message_stop"})
+        else:
+            self._send_json(200, {
+                "id": message_id, "type": "message", "role": "assistant", "model": model,
+                "content": [{"type": "text", "text": text}],
+                "stop_reason": stop_reason, "stop_sequence": None, "usage": usage,
+            })
+
+        elapsed = time.perf_counter() - started
+        mode = "stream" if request.get("stream") else "json"
+        cache = "hit" if usage["cache_read_input_tokens"] else "write" if usage["cache_creation_input_tokens"] else "off"
+        print(f"  #{request_no} {name}: {mode}, {stop_reason}, cache {cache}, {elapsed:.2f}s")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Local mock of the Anthropic Messages API that replays tailoring_result.json fixtures."
+    )
+    parser.add_argument(
+        "fixtures", nargs="*", default=DEFAULT_FIXTURES,
+        help="Fixture files or globs relative to the project root "
+             "(default: applications/*/tailoring_result.json and the bundled sample)",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port (default: 8765)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to wait before responding")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random +/- seconds added to --latency")
+    parser.add_argument("--chunk-size", type=int, default=64, help="Characters per streamed text delta")
+    parser.add_argument("--chunk-delay", type=float, default=0.0, help="Seconds between streamed deltas")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with an error")
+    parser.add_argument("--error-status", type=int, default=529, help="HTTP status for injected errors (default: 529)")
+    parser.add_argument("--truncate", type=float, default=0.0,
+                        help="Fraction of responses cut in half with stop_reason=max_tokens")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for jitter/errors/truncation")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures:
+        print("Error: no fixtures found.")
+        print("Run 'make apply' once to record applications/<company>/tailoring_result.json,")
+        print("or pass fixture paths explicitly.")
+        sys.exit(1)
+
+    MockHandler.state = MockState(fixtures, args)
+    server = ThreadingHTTPServer((args.host, args.port), MockHandler)
+    print(f"Mock LLM listening on http://{args.host}:{args.port} ({len(fixtures)} fixture(s): {', '.join(sorted(fixtures))})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
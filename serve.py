@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""Local HTTP render service: CV / cover letter HTML and PDF on demand.
+
+Keeps the Jinja environment, the data files and one Chromium instance warm,
+coalesces identical concurrent requests and serves repeats from an LRU cache.
+
+    GET  /cv?profile=ai-engineer&lang=en      -> text/html
+    GET  /cv.pdf?profile=default&lang=es      -> application/pdf
+    GET  /cover-letter?lang=es                -> text/html
+    GET  /cover-letter.pdf?lang=en            -> application/pdf
+    POST /cv[.pdf], /cover-letter[.pdf]       -> same, body: {"lang", "tailoring", "company", "role"}
+    GET  /static/<file>                       -> static/ assets the HTML links to
+    GET  /health                              -> cache/worker stats (JSON)
+"""
+
+import argparse
+import hashlib
+import json
+import mimetypes
+import queue
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from build import (
+    COVER_LETTER_FILE,
+    DATA_FILE,
+    LANGS,
+    LOCALES,
+    ROOT,
+    TEMPLATE_DIR,
+    add_pdf_metadata,
+    get_api_key,
+    get_outputs,
+    load_json,
+    open_when_ready,
+    render_cover_letter,
+    render_cv,
+)
+
+
+STATIC_DIR = ROOT / "static"
+
+
+def tree_mtime(directory: Path) -> int:
+    """Newest mtime (ns) of the files under directory, 0 if it is empty or missing."""
+    return max((path.stat().st_mtime_ns for path in directory.rglob("*") if path.is_file()), default=0)
+
+
+class RenderError(Exception):
+    """Client error: bad parameters or unknown profile (HTTP 4xx)."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class DataStore:
+    """cv.json / cover_letter.json loaded once, reloaded when their mtime changes."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.cache = {}
+
+    def get(self, path: Path) -> tuple[dict, int]:
+        mtime = path.stat().st_mtime_ns
+        with self.lock:
+            cached = self.cache.get(path)
+            if cached is None or cached[1] != mtime:
+                cached = (load_json(path), mtime)
+                self.cache[path] = cached
+            return cached
+
+
+class RenderCache:
+    """LRU of rendered bytes plus coalescing of identical in-flight renders."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.inflight = {}
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0}
+
+    def get_or_render(self, key: str, render) -> tuple[bytes, str]:
+        """Return (content, source) where source is hit, coalesced or miss."""
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return self.entries[key], "hit"
+            future = self.inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self.inflight[key] = future
+                self.stats["misses"] += 1
+            else:
+                self.stats["coalesced"] += 1
+
+        if not owner:
+            return future.result(), "coalesced"
+
+        try:
+            content = render()
+        except BaseException as e:
+            with self.lock:
+                self.inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+        with self.lock:
+            self.entries[key] = content
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            self.inflight.pop(key, None)
+        future.set_result(content)
+        return content, "miss"
+
+
+class PdfWorker:
+    """Owns one Chromium instance on a dedicated thread (Playwright sync API is
+    bound to the thread that started it) and prints HTML strings to PDF bytes."""
+
+    def __init__(self):
+        self.jobs = queue.Queue()
+        self.workdir = Path(tempfile.mkdtemp(prefix="cv-serve-"))
+        self.static_mtime = None
+        self.thread = threading.Thread(target=self._run, name="pdf-worker", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        try:
+            from playwright.sync_api import sync_playwright
+
+            with sync_playwright() as p:
+                self._serve(p)
+        except Exception as e:
+            # Fail queued and future jobs instead of leaving request threads blocked
+            print(f"  PDF worker unavailable: {e}")
+            while (job := self.jobs.get()) is not None:
+                job[2].set_exception(e)
+
+    def _serve(self, p):
+        margin = {"top": "0", "bottom": "0", "left": "0", "right": "0"}
+        browser = p.chromium.launch()
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            html, meta, future = job
+            try:
+                self._sync_static()
+                name = hashlib.sha256(html.encode("utf-8")).hexdigest()[:16]
+                html_path = self.workdir / f"{name}.html"
+                pdf_path = self.workdir / f"{name}.pdf"
+                html_path.write_text(html, encoding="utf-8")
+                page = browser.new_page()
+                try:
+                    open_when_ready(page, html_path)
+                    page.pdf(
+                        path=str(pdf_path),
+                        format="A4",
+                        print_background=True,
+                        margin=margin,
+                        tagged=True,
+                        outline=True,
+                    )
+                finally:
+                    page.close()
+                add_pdf_metadata(pdf_path, *meta)
+                future.set_result(pdf_path.read_bytes())
+                html_path.unlink(missing_ok=True)
+                pdf_path.unlink(missing_ok=True)
+            except Exception as e:
+                future.set_exception(e)
+        browser.close()
+
+    def _sync_static(self):
+        """Rendered HTML references static/styles.css relative to itself: keep the
+        workdir copy in step with static/ (re-copied when any file there changes)."""
+        mtime = tree_mtime(STATIC_DIR)
+        if mtime != self.static_mtime:
+            shutil.rmtree(self.workdir / "static", ignore_errors=True)
+            shutil.copytree(STATIC_DIR, self.workdir / "static")
+            self.static_mtime = mtime
+
+    def print_pdf(self, html: str, title: str, author: str, subject: str = "") -> bytes:
+        future = Future()
+        self.jobs.put((html, (title, author, subject), future))
+        return future.result()
+
+    def close(self):
+        self.jobs.put(None)
+        self.thread.join(timeout=10)
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+
+class RenderService:
+    """Maps (document, profile, lang, tailoring) to rendered HTML / PDF bytes."""
+
+    def __init__(self, cache_size: int):
+        self.data = DataStore()
+        self.cache = RenderCache(cache_size)
+        self.pdf = PdfWorker()
+        self.api_key = get_api_key()
+
+    def render(self, doc: str, fmt: str, params: dict) -> tuple[bytes, str]:
+        lang = params.get("lang") or LANGS[0]
+        if lang not in LANGS:
+            raise RenderError(400, f"lang must be one of {', '.join(LANGS)}, got '{lang}'")
+        cv_data, cv_mtime = self.data.get(DATA_FILE)
+        profiles = cv_data.get("profiles", {})
+        profile = params.get("profile") or "default"
+        if profile not in profiles:
+            raise RenderError(404, f"profile '{profile}' not found (available: {', '.join(profiles)})")
+        tailoring = params.get("tailoring")
+        if tailoring is not None and not isinstance(tailoring, dict):
+            raise RenderError(400, "tailoring must be a JSON object (tailoring_result.json format)")
+        letter_mtime = 0
+        if doc == "cover-letter" and not tailoring:
+            if not COVER_LETTER_FILE.exists():
+                raise RenderError(404, f"{COVER_LETTER_FILE.name} not found")
+            letter_mtime = self.data.get(COVER_LETTER_FILE)[1]
+
+        # Data, template and static mtimes are part of the key so edits to
+        # data/*.json, templates/ or static/ invalidate entries
+        key = hashlib.sha256(json.dumps(
+            [doc, fmt, profile, lang, params.get("company"), params.get("role"), tailoring,
+             cv_mtime, letter_mtime, tree_mtime(TEMPLATE_DIR), tree_mtime(STATIC_DIR)],
+            sort_keys=True, ensure_ascii=False,
+        ).encode("utf-8")).hexdigest()
+
+        def produce() -> bytes:
+            html, meta = self._render_html(doc, cv_data, profile, lang, params)
+            if fmt == "pdf":
+                return self.pdf.print_pdf(html, *meta)
+            return html.encode("utf-8")
+
+        return self.cache.get_or_render(key, produce)
+
+    def _render_html(self, doc: str, cv_data: dict, profile: str, lang: str,
+                     params: dict) -> tuple[str, tuple]:
+        author = cv_data.get("personal", {}).get("name", "")
+        tailoring = params.get("tailoring")
+        data = {**cv_data, "profile": cv_data["profiles"][profile]}
+        letter = None
+
+        if tailoring:
+            from tailor import apply_tailoring
+
+            try:
+                data, letter = apply_tailoring(data, tailoring, lang)
+            except (KeyError, TypeError, ValueError, IndexError) as e:
+                raise RenderError(400, f"invalid tailoring payload: {e!r}")
+            letter["company"] = params.get("company", "")
+            letter["role"] = params.get("role", "")
+            profile = tailoring.get("chosen_profile", profile)
+
+        if doc == "cv":
+            pdf_name = get_outputs(profile if profile in cv_data["profiles"] else "default")[lang]["pdf"]
+            html = render_cv(data, lang, self.api_key, pdf_name, profile)
+            return html, (f"{author} — CV", author)
+
+        if letter is None:
+            letter = self.data.get(COVER_LETTER_FILE)[0]
+        html = render_cover_letter(data, letter, lang)
+        subject = LOCALES[lang]["cover_letter"]["subject"]
+        return html, (f"{author} — {subject}", author, subject)
+
+    def health(self) -> dict:
+        with self.cache.lock:
+            return {
+                "cached": len(self.cache.entries),
+                "inflight": len(self.cache.inflight),
+                **self.cache.stats,
+            }
+
+    def close(self):
+        self.pdf.close()
+
+
+ROUTES = {
+    "/cv": ("cv", "html"),
+    "/cv.pdf": ("cv", "pdf"),
+    "/cover-letter": ("cover-letter", "html"),
+    "/cover-letter.pdf": ("cover-letter", "pdf"),
+}
+CONTENT_TYPES = {"html": "text/html; charset=utf-8", "pdf": "application/pdf"}
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    server_version = "CVRender/1.0"
+    service: RenderService
+
+    def log_message(self, format, *args):
+        pass  # one summary line per request is printed in _handle
+
+    def _send(self, status: int, content_type: str, body: bytes, cache: str = "") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if cache:
+            self.send_header("X-Cache", cache)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        self._send(status, "application/json", json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+    def _send_static(self, path: str) -> None:
+        asset = (STATIC_DIR / path.removeprefix("/static/")).resolve()
+        if not asset.is_file() or not asset.is_relative_to(STATIC_DIR.resolve()):
+            self._send_json(404, {"error": f"no static file {path}"})
+            return
+        content_type = mimetypes.guess_type(asset.name)[0] or "application/octet-stream"
+        self._send(200, content_type, asset.read_bytes())
+
+    def _handle(self, params: dict) -> None:
+        path = urlparse(self.path).path
+        if path == "/health":
+            self._send_json(200, self.service.health())
+            return
+        if path.startswith("/static/"):
+            self._send_static(path)
+            return
+        if path not in ROUTES:
+            self._send_json(404, {"error": f"unknown endpoint {path}", "endpoints": sorted(ROUTES)})
+            return
+        doc, fmt = ROUTES[path]
+        try:
+            body, cache = self.service.render(doc, fmt, params)
+        except RenderError as e:
+            self._send_json(e.status, {"error": str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+            print(f"  {self.command} {self.path}: 500 {e}")
+            return
+        self._send(200, CONTENT_TYPES[fmt], body, cache)
+        print(f"  {self.command} {self.path}: {len(body)} bytes ({cache})")
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        self._handle({key: values[-1] for key, values in query.items()})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            params = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as e:
+            self._send_json(400, {"error": f"invalid JSON body: {e}"})
+            return
+        if not isinstance(params, dict):
+            self._send_json(400, {"error": "JSON body must be an object"})
+            return
+        # Query string (e.g. ?lang=en) fills anything the body does not set
+        query = parse_qs(urlparse(self.path).query)
+        for key, values in query.items():
+            params.setdefault(key, values[-1])
+        self._handle(params)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Serve CV and cover letter HTML/PDF variants on demand."
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8766, help="Port (default: 8766)")
+    parser.add_argument("--cache-size", type=int, default=64,
+                        help="Max rendered documents kept in memory (default: 64)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    service = RenderService(args.cache_size)
+    RenderHandler.service = service
+    server = ThreadingHTTPServer((args.host, args.port), RenderHandler)
+    print(f"Render service on http://{args.host}:{args.port} (endpoints: {', '.join(sorted(ROUTES))}, /static/, /health)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -161,6 +161,7 @@ function showLoading() {
 }
 
 function showResult(text, isInterview = false) {
+    if (text === null) return;  // superseded by a newer request
     document.getElementById('aiLoading').classList.add('hidden');
     document.getElementById('aiLoading').classList.remove('flex');
     document.getElementById('aiResult').classList.remove('hidden');
@@ -173,20 +174,146 @@ function showResult(text, isInterview = false) {
 }
 
 // -- Gemini API --
-async function callGemini(prompt) {
-    showLoading();
+const GEMINI_MODEL = "gemini-2.5-flash-preview-09-2025";
+
+// -- Response Cache (localStorage, size-bounded LRU) --
+// Keyed on model + CV variant (profile:lang, set by render_cv) + prompt, so a
+// rebuilt CV with different content produces different prompts and new keys.
+const AI_CACHE_PREFIX = "ai_cache:";
+const AI_CACHE_INDEX = "ai_cache_index";
+const AI_CACHE_MAX_ENTRIES = 50;
+const AI_CACHE_MAX_BYTES = 512 * 1024;
+
+function hashKey(text) {
+    // FNV-1a (32-bit) over two seeds: synchronous, no crypto.subtle needed on file://
+    let h1 = 0x811c9dc5, h2 = 0x01000193 ^ text.length;
+    for (let i = 0; i < text.length; i++) {
+        const c = text.charCodeAt(i);
+        h1 = Math.imul(h1 ^ c, 0x01000193);
+        h2 = Math.imul(h2 ^ c, 0x5bd1e995);
+    }
+    return (h1 >>> 0).toString(16).padStart(8, "0") + (h2 >>> 0).toString(16).padStart(8, "0");
+}
+
+function cacheKeyFor(prompt) {
+    return hashKey(`${GEMINI_MODEL}\n${CV_CONFIG.variant || ""}\n${prompt}`);
+}
+
+function readCacheIndex() {
     try {
-        const res = await fetch(
-            `https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-preview-09-2025:generateContent?key=${CV_CONFIG.apiKey}`,
-            {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ contents: [{ parts: [{ text: prompt }] }] })
+        const index = JSON.parse(localStorage.getItem(AI_CACHE_INDEX));
+        if (Array.isArray(index)) return index;
+    } catch (e) { /* corrupt index: start over */ }
+    return [];
+}
+
+function writeCacheIndex(index) {
+    try { localStorage.setItem(AI_CACHE_INDEX, JSON.stringify(index)); } catch (e) { /* storage full or disabled */ }
+}
+
+function cacheGet(key) {
+    let text = null;
+    try { text = localStorage.getItem(AI_CACHE_PREFIX + key); } catch (e) { return null; }
+    const index = readCacheIndex();
+    const pos = index.findIndex(entry => entry.key === key);
+    if (text === null) {
+        if (pos !== -1) { index.splice(pos, 1); writeCacheIndex(index); }
+        return null;
+    }
+    // Move to most-recently-used position
+    if (pos !== -1) index.push(index.splice(pos, 1)[0]);
+    else index.push({ key, size: text.length * 2 });
+    writeCacheIndex(index);
+    return text;
+}
+
+function evictOldest(index) {
+    const oldest = index.shift();
+    if (oldest) localStorage.removeItem(AI_CACHE_PREFIX + oldest.key);
+    return Boolean(oldest);
+}
+
+function cachePut(key, text) {
+    const size = text.length * 2;  // localStorage stores UTF-16
+    if (size > AI_CACHE_MAX_BYTES) return;
+    const index = readCacheIndex().filter(entry => entry.key !== key);
+    index.push({ key, size });
+    let total = index.reduce((sum, entry) => sum + entry.size, 0);
+    while (index.length > AI_CACHE_MAX_ENTRIES || total > AI_CACHE_MAX_BYTES) {
+        total -= index[0].size;
+        evictOldest(index);
+    }
+    // On quota errors, keep evicting least-recently-used entries until it fits
+    for (;;) {
+        try {
+            localStorage.setItem(AI_CACHE_PREFIX + key, text);
+            break;
+        } catch (e) {
+            if (index.length <= 1 || !evictOldest(index)) {
+                index.pop();
+                break;
             }
-        );
+        }
+    }
+    writeCacheIndex(index);
+}
+
+// -- Request Coalescing / Cancellation --
+// Identical in-flight prompts share one fetch; starting a different prompt
+// aborts the previous one (as does a cache hit), whose caller then receives
+// null and renders nothing.
+const inflightRequests = new Map();
+let activeRequest = null;
+
+function fetchGemini(prompt, signal) {
+    return fetch(
+        `https://generativelanguage.googleapis.com/v1beta/models/${GEMINI_MODEL}:generateContent?key=${CV_CONFIG.apiKey}`,
+        {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ contents: [{ parts: [{ text: prompt }] }] }),
+            signal
+        }
+    ).then(async res => {
         const data = await res.json();
+        if (!res.ok || !data.candidates) throw new Error(`Gemini HTTP ${res.status}`);
         return data.candidates[0].content.parts[0].text;
+    });
+}
+
+async function callGemini(prompt, { cache = true } = {}) {
+    showLoading();
+    const key = cacheKeyFor(prompt);
+    if (cache) {
+        const cached = cacheGet(key);
+        if (cached !== null) {
+            // A cached answer is the latest request too: drop the one still in flight
+            if (activeRequest) activeRequest.controller.abort();
+            activeRequest = null;
+            return cached;
+        }
+    }
+
+    let request = inflightRequests.get(key);
+    if (!request) {
+        if (activeRequest) activeRequest.controller.abort();
+        const controller = new AbortController();
+        request = { key, controller, promise: fetchGemini(prompt, controller.signal) };
+        inflightRequests.set(key, request);
+        request.promise
+            .then(text => { if (cache) cachePut(key, text); })
+            .catch(() => {})
+            .finally(() => {
+                inflightRequests.delete(key);
+                if (activeRequest === request) activeRequest = null;
+            });
+    }
+    activeRequest = request;
+
+    try {
+        return await request.promise;
     } catch (e) {
+        if (e.name === 'AbortError') return null;
         return CV_CONFIG.i18n.connectionError;
     }
 }
@@ -202,7 +329,10 @@ async function generateElevatorPitch() {
 
 async function startMockInterview() {
     requireApiKey(async () => {
-        currentQuestion = await callGemini(CV_CONFIG.prompts.mockInterview(getCVText()));
+        // Not cached: each practice run should get a fresh question
+        const question = await callGemini(CV_CONFIG.prompts.mockInterview(getCVText()), { cache: false });
+        if (question === null) return;
+        currentQuestion = question;
         showResult(`### ${CV_CONFIG.i18n.interviewQuestionLabel}:\n\n${currentQuestion}`, true);
     });
 }
@@ -2,21 +2,27 @@
 """Tailor CV and cover letter for a specific job offer using Claude API."""
 
 import argparse
-import copy
 import json
 import os
 import re
 import shutil
 import sys
+import time
+from collections import ChainMap
+from collections.abc import Mapping
 from pathlib import Path
 
-from anthropic import Anthropic
+from anthropic import Anthropic, APIError
 
 from build import (
+    LANGS,
+    LOCALES,
     ROOT,
     add_pdf_metadata,
     get_api_key,
     load_json,
+    merge_pdfs,
+    open_when_ready,
     render_cover_letter,
     render_cv,
 )
@@ -25,6 +31,7 @@ DATA_DIR = ROOT / "data"
 JOB_OFFER_FILE = DATA_DIR / "job_offer.json"
 CV_FILE = DATA_DIR / "cv.json"
 APPLICATIONS_DIR = ROOT / "applications"
+DEFAULT_MODEL = "claude-sonnet-4-20250514"
 
 
 def get_anthropic_key() -> str:
@@ -44,6 +51,19 @@ def get_anthropic_key() -> str:
     return key
 
 
+def get_anthropic_base_url() -> str | None:
+    """Resolve ANTHROPIC_BASE_URL from env var or .env file (None = official API)."""
+    url = os.environ.get("ANTHROPIC_BASE_URL", "")
+    if not url:
+        env_file = ROOT / ".env"
+        if env_file.exists():
+            for line in env_file.read_text().splitlines():
+                if line.startswith("ANTHROPIC_BASE_URL="):
+                    url = line.split("=", 1)[1].strip().strip('"').strip("'")
+                    break
+    return url or None
+
+
 def slugify(text: str) -> str:
     """Convert text to filesystem-safe slug."""
     slug = text.lower().strip()
@@ -62,46 +82,44 @@ def company_label(company: str) -> str:
     )
 
 
-def build_tailoring_prompt(cv_data: dict, job_offer: dict, lang: str) -> str:
-    """Build the prompt for Claude to tailor the CV and generate a cover letter."""
-    lang_name = "Spanish" if lang == "es" else "English"
-    num_exp = len(cv_data.get("experience", []))
+def build_tailoring_prompt(cv_data: dict, job_offer: dict, lang: str) -> list[dict]:
+    """Build the user message content for Claude as two text blocks.
 
-    return f"""You are an expert career consultant. Tailor a CV and generate a cover letter for a specific job offer.
+    The first block (rules, CV data, output format) is identical for every offer
+    and language and is marked for prompt caching; only the second block (target
+    language + job offer) changes between requests. Keys starting with "_" are
+    run-specific and stay out of the cached CV dump.
+    """
+    lang_name = LOCALES[lang]["english_name"]
+    cv_source = {key: value for key, value in cv_data.items() if not key.startswith("_")}
+    num_exp = len(cv_source.get("experience", []))
+
+    prefix = f"""You are an expert career consultant. Tailor a CV and generate a cover letter for a specific job offer.
 
 CRITICAL RULES:
 - NEVER invent or fabricate experience, skills, or achievements
 - ONLY reformulate, reorder, and emphasize what already exists in the CV data
 - Keep all facts (dates, companies, metrics, numbers) exactly as they are
 - You may rephrase bullet points to better highlight keywords from the job offer
-- All output must be in {lang_name} ("{lang}")
+- All output must be in the OUTPUT LANGUAGE given after the CV data
 
 ## CV DATA (source of truth):
 ```json
-{json.dumps(cv_data, ensure_ascii=False, indent=2)}
+{json.dumps(cv_source, ensure_ascii=False, indent=2)}
 ```
 
-## JOB OFFER:
-- Company: {job_offer.get('company', 'N/A')}
-- Role: {job_offer.get('role', 'N/A')}
-- Location: {job_offer.get('location', 'N/A')}
-- Description: {job_offer.get('description', 'N/A')}
-- Requirements: {json.dumps(job_offer.get('requirements', []), ensure_ascii=False)}
-- Nice to have: {json.dumps(job_offer.get('nice_to_have', []), ensure_ascii=False)}
-- Notes: {job_offer.get('notes', '')}
-
 ## YOUR TASK:
 Return a JSON object with exactly this structure:
 {{
   "chosen_profile": "<best matching profile from: default, ai-engineer, ml-engineer, mlops>",
-  "tailored_summary": "<rewritten professional summary tailored to this offer, in {lang_name}. Use <strong> tags for key terms matching the offer. 3-4 sentences max. Based ONLY on real experience.>",
+  "tailored_summary": "<rewritten professional summary tailored to this offer, in the output language. Use <strong> tags for key terms matching the offer. 3-4 sentences max. Based ONLY on real experience.>",
   "experience_order": [<indices 0 to {num_exp - 1} of experience entries, ordered by relevance to this offer. Most relevant first. Include ALL indices.>],
   "experience_bullets": {{
-    "<index>": [<reordered AND/OR rephrased bullets for that experience entry in "{lang}". Keep all facts identical. Emphasize keywords from the offer. Only include entries that exist in "{lang}".>]
+    "<index>": [<reordered AND/OR rephrased bullets for that experience entry in the output language code. Keep all facts identical. Emphasize keywords from the offer. Only include entries whose "langs" contain the output language code.>]
   }},
   "cover_letter": {{
-    "recipient": "<appropriate recipient in {lang_name}>",
-    "date": "<today's date formatted in {lang_name}>",
+    "recipient": "<appropriate recipient in the output language>",
+    "date": "<today's date formatted in the output language>",
     "subject": "<application subject line>",
     "greeting": "<greeting>",
     "opening": "<compelling opening paragraph tailored to this company and role. May use <strong> for emphasis.>",
@@ -117,17 +135,54 @@ Return a JSON object with exactly this structure:
 
 Return ONLY the JSON object. No markdown fences, no explanations."""
 
+    suffix = f"""## OUTPUT LANGUAGE: {lang_name} ("{lang}")
 
-def call_claude(prompt: str, api_key: str) -> dict:
-    """Call Claude API and parse the JSON response."""
-    client = Anthropic(api_key=api_key)
-
-    print("  Calling Claude API...")
-    message = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=4096,
-        messages=[{"role": "user", "content": prompt}],
-    )
+## JOB OFFER:
+- Company: {job_offer.get('company', 'N/A')}
+- Role: {job_offer.get('role', 'N/A')}
+- Location: {job_offer.get('location', 'N/A')}
+- Description: {job_offer.get('description', 'N/A')}
+- Requirements: {json.dumps(job_offer.get('requirements', []), ensure_ascii=False)}
+- Nice to have: {json.dumps(job_offer.get('nice_to_have', []), ensure_ascii=False)}
+- Notes: {job_offer.get('notes', '')}"""
+
+    return [
+        {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": suffix},
+    ]
+
+
+def call_claude(prompt: str | list[dict], api_key: str, base_url: str | None = None,
+                model: str = DEFAULT_MODEL) -> dict:
+    """Call Claude API and parse the JSON response.
+
+    prompt is the user message content: a string or content blocks (see
+    build_tailoring_prompt). base_url points the client at another Messages API
+    endpoint, e.g. the local mock_llm.py server used for offline tests and benchmarks.
+    """
+    client = Anthropic(api_key=api_key, base_url=base_url)
+
+    print(f"  Calling Claude API ({model}{f' @ {base_url}' if base_url else ''})...")
+    start = time.perf_counter()
+    try:
+        message = client.messages.create(
+            model=model,
+            max_tokens=4096,
+            messages=[{"role": "user", "content": prompt}],
+        )
+    except APIError as e:
+        print(f"Error: Claude API request failed: {e}")
+        sys.exit(1)
+    usage = message.usage
+    cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+    cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+    print(f"  Response in {time.perf_counter() - start:.2f}s "
+          f"({usage.input_tokens} in / {usage.output_tokens} out tokens, "
+          f"cache: {cache_read} read / {cache_write} written)")
+
+    if message.stop_reason == "max_tokens":
+        print("Error: Claude response was truncated (max_tokens reached).")
+        sys.exit(1)
 
     response_text = message.content[0].text.strip()
     # Remove markdown fences if present
@@ -136,31 +191,48 @@ def call_claude(prompt: str, api_key: str) -> dict:
     if response_text.endswith("```"):
         response_text = response_text.rsplit("```", 1)[0].strip()
 
-    return json.loads(response_text)
+    try:
+        return json.loads(response_text)
+    except json.JSONDecodeError as e:
+        print(f"Error: Claude response is not valid JSON ({e}).")
+        sys.exit(1)
+
+
+def _with_bullets(entry: Mapping, lang: str, bullets: list) -> Mapping:
+    """Overlay rewritten bullets for one language onto an experience entry."""
+    if lang not in entry.get("items", {}):
+        return entry
+    return ChainMap({"items": ChainMap({lang: bullets}, entry["items"])}, entry)
 
 
-def apply_tailoring(cv_data: dict, tailoring: dict, lang: str) -> tuple[dict, dict]:
-    """Apply Claude's tailoring to cv_data. Returns (tailored_cv, cover_letter_data)."""
-    tailored = copy.deepcopy(cv_data)
+def apply_tailoring(cv_data: Mapping, tailoring: dict, lang: str) -> tuple[Mapping, dict]:
+    """Apply Claude's tailoring to cv_data. Returns (tailored_cv, cover_letter_data).
 
-    # Apply tailored summary as the profile
-    tailored["profile"] = {lang: tailoring["tailored_summary"]}
+    tailored_cv is a copy-on-write overlay (ChainMap) on cv_data: it stores only
+    the summary, the experience order and the rewritten entries, and shares
+    everything else with the base CV, which is never mutated.
+    """
+    experience = cv_data["experience"]
 
-    # Reorder experience entries by relevance
-    order = tailoring.get("experience_order", list(range(len(tailored["experience"]))))
-    original_exp = tailored["experience"]
-    tailored["experience"] = [original_exp[i] for i in order if i < len(original_exp)]
+    # Reorder experience entries by relevance (positions index the filtered order)
+    order = [i for i in tailoring.get("experience_order", range(len(experience)))
+             if i < len(experience)]
 
-    # Apply rephrased/reordered bullets
-    experience_bullets = tailoring.get("experience_bullets", {})
-    for str_idx, bullets in experience_bullets.items():
-        orig_idx = int(str_idx)
-        # Find where this entry ended up after reordering
-        if orig_idx in order:
-            new_pos = order.index(orig_idx)
-            entry = tailored["experience"][new_pos]
-            if lang in entry.get("items", {}):
-                entry["items"][lang] = bullets
+    # Rephrased/reordered bullets, keyed by original index
+    experience_bullets = {
+        int(str_idx): bullets
+        for str_idx, bullets in tailoring.get("experience_bullets", {}).items()
+    }
+
+    tailored = ChainMap({
+        # Tailored summary replaces the profile
+        "profile": {lang: tailoring["tailored_summary"]},
+        "experience": [
+            _with_bullets(experience[i], lang, experience_bullets[i])
+            if i in experience_bullets else experience[i]
+            for i in order
+        ],
+    }, cv_data)
 
     # Build cover letter data (i18n structure with single language)
     cl = tailoring["cover_letter"]
@@ -194,8 +266,7 @@ def generate_tailored_pdfs(output_dir: Path, html_pdf_pairs: list[tuple[Path, Pa
         browser = p.chromium.launch()
         for html_path, pdf_path in html_pdf_pairs:
             page = browser.new_page()
-            page.goto(f"file://{html_path.resolve()}", wait_until="networkidle")
-            page.evaluate("async () => { await document.fonts.ready; }")
+            open_when_ready(page, html_path)
             page.pdf(
                 path=str(pdf_path),
                 format="A4",
@@ -209,6 +280,61 @@ def generate_tailored_pdfs(output_dir: Path, html_pdf_pairs: list[tuple[Path, Pa
         browser.close()
 
 
+def bundle_path_for(cv_pdf: Path, lang: str) -> Path:
+    """CV-<author>-<company>-<LANG>.pdf -> <bundle prefix>-<author>-<company>-<LANG>.pdf"""
+    return cv_pdf.with_name(LOCALES[lang]["bundle"]["prefix"] + cv_pdf.name.removeprefix("CV"))
+
+
+def bundle_application(cv_pdf: Path, letter_pdf: Path, lang: str, author: str, company: str) -> Path:
+    """Merge an application's cover letter and CV PDFs into one upload (no re-render)."""
+    locale = LOCALES[lang]
+    subject = locale["bundle"]["subject"]
+    bundle_path = bundle_path_for(cv_pdf, lang)
+    merge_pdfs(
+        [(letter_pdf, locale["cover_letter"]["subject"]), (cv_pdf, "CV")],
+        bundle_path,
+        f"{author} - {subject} ({company})",
+        author,
+        subject,
+    )
+    print(f"  Bundle: {bundle_path.relative_to(ROOT)}")
+    return bundle_path
+
+
+def application_company(app_dir: Path) -> str:
+    """Company name recorded with the application (see main), else the directory slug."""
+    result_path = app_dir / "tailoring_result.json"
+    if result_path.exists():
+        company = load_json(result_path).get("_job", {}).get("company")
+        if company:
+            return company
+    return app_dir.name
+
+
+def bundle_applications(author: str) -> None:
+    """Bundle every application in applications/ whose PDFs are newer than its bundle."""
+    print("Bundling applications...")
+    bundled = up_to_date = 0
+    for app_dir in sorted(path for path in APPLICATIONS_DIR.glob("*") if path.is_dir()):
+        for lang, locale in LOCALES.items():
+            lang_label = locale["pdf_suffix"]
+            cvs = list(app_dir.glob(f"CV-*-{lang_label}.pdf"))
+            letters = list(app_dir.glob(f"{locale['cover_letter']['prefix']}-*-{lang_label}.pdf"))
+            if not cvs or not letters:
+                continue
+            cv_pdf = max(cvs, key=lambda path: path.stat().st_mtime)
+            letter_pdf = max(letters, key=lambda path: path.stat().st_mtime)
+            bundle_path = bundle_path_for(cv_pdf, lang)
+            newest_part = max(cv_pdf.stat().st_mtime, letter_pdf.stat().st_mtime)
+            if bundle_path.exists() and bundle_path.stat().st_mtime >= newest_part:
+                up_to_date += 1
+                continue
+            company = application_company(app_dir)
+            bundle_application(cv_pdf, letter_pdf, lang, author, company)
+            bundled += 1
+    print(f"  {bundled} bundle(s) written, {up_to_date} up to date")
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Tailor CV and cover letter for a job offer using Claude API."
@@ -217,7 +343,24 @@ def parse_args() -> argparse.Namespace:
         "--html-only", action="store_true", help="Skip PDF generation"
     )
     parser.add_argument(
-        "--lang", type=str, default=None, help="Override language (es/en)"
+        "--lang", type=str, default=None, help=f"Override language ({'/'.join(LANGS)})"
+    )
+    parser.add_argument(
+        "--bundle", action="store_true",
+        help="Also merge the cover letter and CV PDFs into one application PDF",
+    )
+    parser.add_argument(
+        "--bundle-all", action="store_true",
+        help="Only bundle every application in applications/ (no API call); "
+             "bundles newer than their PDFs are skipped",
+    )
+    parser.add_argument(
+        "--base-url", type=str, default=None,
+        help="Messages API base URL (default: ANTHROPIC_BASE_URL or the official API), "
+             "e.g. http://127.0.0.1:8765 for mock_llm.py",
+    )
+    parser.add_argument(
+        "--model", type=str, default=DEFAULT_MODEL, help=f"Claude model (default: {DEFAULT_MODEL})"
     )
     return parser.parse_args()
 
@@ -225,6 +368,14 @@ def parse_args() -> argparse.Namespace:
 def main():
     args = parse_args()
 
+    if args.bundle and args.html_only:
+        print("Error: --bundle merges the generated PDFs and cannot be used with --html-only.")
+        sys.exit(1)
+
+    if args.bundle_all:
+        bundle_applications(load_json(CV_FILE).get("personal", {}).get("name", ""))
+        return
+
     # Load job offer
     if not JOB_OFFER_FILE.exists():
         print(f"Error: {JOB_OFFER_FILE} not found.")
@@ -242,9 +393,9 @@ def main():
         print("Error: job_offer.json must have 'company' and 'role' fields.")
         sys.exit(1)
 
-    lang = args.lang or job_offer.get("lang", "es")
-    if lang not in ("es", "en"):
-        print(f"Error: lang must be 'es' or 'en', got '{lang}'")
+    lang = args.lang or job_offer.get("lang", LANGS[0])
+    if lang not in LANGS:
+        print(f"Error: lang must be one of {', '.join(LANGS)}, got '{lang}'")
         sys.exit(1)
 
     # Prepare output directory
@@ -264,10 +415,10 @@ def main():
     author = cv_data.get("personal", {}).get("name", "")
     author_slug = author.replace(" ", "-")
     comp_label = company_label(company)
-    lang_label = lang.upper()
+    lang_label = LOCALES[lang]["pdf_suffix"]
 
     cv_pdf_name = f"CV-{author_slug}-{comp_label}-{lang_label}.pdf"
-    carta_prefix = "Carta" if lang == "es" else "Cover-Letter"
+    carta_prefix = LOCALES[lang]["cover_letter"]["prefix"]
     carta_pdf_name = f"{carta_prefix}-{author_slug}-{comp_label}-{lang_label}.pdf"
 
     print(f"\nTailoring CV for: {company} - {role} ({lang_label})")
@@ -277,7 +428,8 @@ def main():
     cv_data["_job_company"] = company
     cv_data["_job_role"] = role
     prompt = build_tailoring_prompt(cv_data, job_offer, lang)
-    tailoring = call_claude(prompt, anthropic_key)
+    base_url = args.base_url or get_anthropic_base_url()
+    tailoring = call_claude(prompt, anthropic_key, base_url, args.model)
 
     chosen_profile = tailoring.get("chosen_profile", "default")
     print(f"  Profile chosen: {chosen_profile}")
@@ -320,22 +472,27 @@ def main():
                 )
             carta_pdf_path = output_dir / carta_pdf_name
             if carta_pdf_path.exists():
-                subject = "Carta de Presentacion" if lang == "es" else "Cover Letter"
+                subject = LOCALES[lang]["cover_letter"]["subject"]
                 add_pdf_metadata(
                     carta_pdf_path,
                     f"{author} - {subject} ({company})",
                     author,
                     subject,
                 )
+            if args.bundle and cv_pdf_path.exists() and carta_pdf_path.exists():
+                bundle_application(cv_pdf_path, carta_pdf_path, lang, author, company)
         except Exception as e:
             print(f"\n  Error generating PDFs: {e}")
             print("  Make sure Playwright is installed: uv run playwright install chromium")
             sys.exit(1)
 
-    # Save the tailoring result for reference
+    # Save the tailoring result for reference, with the offer it was made for
+    # (read back by --bundle-all; mock_llm.py drops "_" keys when replaying it)
     tailoring_path = output_dir / "tailoring_result.json"
     tailoring_path.write_text(
-        json.dumps(tailoring, ensure_ascii=False, indent=2), encoding="utf-8"
+        json.dumps({**tailoring, "_job": {"company": company, "role": role, "lang": lang}},
+                   ensure_ascii=False, indent=2),
+        encoding="utf-8",
     )
 
     print(f"\nDone! Files in: {output_dir.relative_to(ROOT)}/")